@@ -1,3 +1,5 @@
+// Build with -tags sqlite_fts5 so go-sqlite3 includes FTS5, which backs the
+// chat name search index (see createChatSearchIndex).
 package main
 
 import (
@@ -53,8 +55,8 @@ func NewMessageStore() (*MessageStore, error) {
 		return nil, fmt.Errorf("failed to create store directory: %v", err)
 	}
 
-	// Open SQLite database for messages
-	db, err := sql.Open("sqlite3", "file:store/messages.db?_foreign_keys=on")
+	// Open SQLite database for messages; WAL lets the MCP server read while we write
+	db, err := sql.Open("sqlite3", "file:store/messages.db?_foreign_keys=on&_journal_mode=WAL")
 	if err != nil {
 		return nil, fmt.Errorf("failed to open message database: %v", err)
 	}
@@ -84,15 +86,83 @@ func NewMessageStore() (*MessageStore, error) {
 			PRIMARY KEY (id, chat_jid),
 			FOREIGN KEY (chat_jid) REFERENCES chats(jid)
 		);
+
+		CREATE INDEX IF NOT EXISTS idx_messages_chat_time ON messages (chat_jid, timestamp DESC);
 	`)
 	if err != nil {
 		db.Close()
 		return nil, fmt.Errorf("failed to create tables: %v", err)
 	}
 
+	// The chat name index needs FTS5, which go-sqlite3 only compiles in with
+	// the sqlite_fts5 build tag (go run -tags sqlite_fts5 main.go)
+	if err := createChatSearchIndex(db); err != nil {
+		fmt.Printf("Warning: chat name search index disabled: %v\n", err)
+	}
+
 	return &MessageStore{db: db}, nil
 }
 
+// Create the trigram full-text index over chat names and keep it in sync with
+// the chats table. FTS rowids mirror chats rowids; INSERT OR REPLACE does not
+// fire delete triggers, so the stale entry is dropped before each insert.
+//
+// When this binary lacks FTS5, triggers left behind by an earlier tagged
+// build would fail every chat insert with "no such module: fts5", so they are
+// dropped. The MCP server only uses the index while its triggers exist, and
+// the index is rebuilt from chats on every start to catch up on missed writes.
+func createChatSearchIndex(db *sql.DB) error {
+	var hasFTS5 int
+	if err := db.QueryRow("SELECT sqlite_compileoption_used('ENABLE_FTS5')").Scan(&hasFTS5); err != nil {
+		return fmt.Errorf("failed to check for FTS5 support: %v", err)
+	}
+	if hasFTS5 == 0 {
+		_, err := db.Exec(`
+			DROP TRIGGER IF EXISTS chats_fts_before_insert;
+			DROP TRIGGER IF EXISTS chats_fts_after_insert;
+			DROP TRIGGER IF EXISTS chats_fts_after_update;
+			DROP TRIGGER IF EXISTS chats_fts_after_delete;
+		`)
+		if err != nil {
+			return fmt.Errorf("SQLite was built without FTS5 and stale index triggers could not be removed: %v", err)
+		}
+		return fmt.Errorf("SQLite was built without FTS5; rebuild with -tags sqlite_fts5")
+	}
+
+	tx, err := db.Begin()
+	if err != nil {
+		return err
+	}
+	defer tx.Rollback()
+
+	_, err = tx.Exec(`
+		CREATE VIRTUAL TABLE IF NOT EXISTS chats_fts USING fts5(name, tokenize = 'trigram');
+
+		CREATE TRIGGER IF NOT EXISTS chats_fts_before_insert BEFORE INSERT ON chats BEGIN
+			DELETE FROM chats_fts WHERE rowid = (SELECT rowid FROM chats WHERE jid = new.jid);
+		END;
+
+		CREATE TRIGGER IF NOT EXISTS chats_fts_after_insert AFTER INSERT ON chats BEGIN
+			INSERT INTO chats_fts (rowid, name) VALUES (new.rowid, new.name);
+		END;
+
+		CREATE TRIGGER IF NOT EXISTS chats_fts_after_update AFTER UPDATE OF name ON chats BEGIN
+			UPDATE chats_fts SET name = new.name WHERE rowid = new.rowid;
+		END;
+
+		CREATE TRIGGER IF NOT EXISTS chats_fts_after_delete AFTER DELETE ON chats BEGIN
+			DELETE FROM chats_fts WHERE rowid = old.rowid;
+		END;
+
+		DELETE FROM chats_fts;
+		INSERT INTO chats_fts (rowid, name) SELECT rowid, name FROM chats;
+	`)
+	if err != nil {
+		return err
+	}
+	return tx.Commit()
+}
+
 // Close the database connection
 func (store *MessageStore) Close() error {
 	return store.db.Close()
@@ -1,10 +1,19 @@
-from typing import List, Dict, Any, Optional
-import json
+from typing import List, Dict, Any, Optional, Tuple
+import asyncio
+import inspect
 import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+import orjson
 from mcp.server.fastmcp import FastMCP
 from whatsapp import (
+    MESSAGES_DB_PATH as DB_PATH,
     search_contacts as whatsapp_search_contacts,
     list_messages as whatsapp_list_messages,
+    fetch_messages as whatsapp_fetch_messages,
+    format_messages_list as whatsapp_format_messages_list,
     list_chats as whatsapp_list_chats,
     get_chat as whatsapp_get_chat,
     get_direct_chat_by_contact as whatsapp_get_direct_chat_by_contact,
@@ -20,6 +29,22 @@ from whatsapp import (
 # Initialize FastMCP server
 mcp = FastMCP("whatsapp")
 
+
+def _to_json(value: Any) -> str:
+    """Serialize a tool result once so FastMCP passes it through as text."""
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+
+
+# Options for tools returning pre-encoded JSON. Newer FastMCP versions also
+# attach a structured {"result": ...} copy of str results, which would send the
+# JSON twice; older versions have no structured output or option for it.
+_JSON_TOOL_OPTIONS = (
+    {"structured_output": False}
+    if "structured_output" in inspect.signature(FastMCP.tool).parameters
+    else {}
+)
+
+
 @mcp.tool()
 def search_contacts(query: str) -> List[Dict[str, Any]]:
     """Search WhatsApp contacts by name or phone number.
@@ -42,8 +67,8 @@ def list_messages(
     include_context: bool = True,
     context_before: int = 1,
     context_after: int = 1
-) -> List[Dict[str, Any]]:
-    """Get WhatsApp messages matching specified criteria with optional context.
+) -> str:
+    """Get WhatsApp messages matching specified criteria with optional context, formatted as text.
     
     Args:
         after: Optional ISO-8601 formatted string to only return messages after this date
@@ -71,15 +96,15 @@ def list_messages(
     )
     return messages
 
-@mcp.tool()
+@mcp.tool(**_JSON_TOOL_OPTIONS)
 def list_chats(
     query: Optional[str] = None,
     limit: int = 20,
     page: int = 0,
     include_last_message: bool = True,
     sort_by: str = "last_active"
-) -> List[Dict[str, Any]]:
-    """Get WhatsApp chats matching specified criteria.
+) -> str:
+    """Get WhatsApp chats matching specified criteria, as a JSON array.
     
     Args:
         query: Optional search term to filter chats by name or JID
@@ -95,7 +120,7 @@ def list_chats(
         include_last_message=include_last_message,
         sort_by=sort_by
     )
-    return chats
+    return _to_json(chats)
 
 @mcp.tool()
 def get_chat(chat_jid: str, include_last_message: bool = True) -> Dict[str, Any]:
@@ -118,9 +143,9 @@ def get_direct_chat_by_contact(sender_phone_number: str) -> Dict[str, Any]:
     chat = whatsapp_get_direct_chat_by_contact(sender_phone_number)
     return chat
 
-@mcp.tool()
-def get_contact_chats(jid: str, limit: int = 20, page: int = 0) -> List[Dict[str, Any]]:
-    """Get all WhatsApp chats involving the contact.
+@mcp.tool(**_JSON_TOOL_OPTIONS)
+def get_contact_chats(jid: str, limit: int = 20, page: int = 0) -> str:
+    """Get all WhatsApp chats involving the contact, as a JSON array.
     
     Args:
         jid: The contact's JID to search for
@@ -128,7 +153,7 @@ def get_contact_chats(jid: str, limit: int = 20, page: int = 0) -> List[Dict[str
         page: Page number for pagination (default 0)
     """
     chats = whatsapp_get_contact_chats(jid, limit, page)
-    return chats
+    return _to_json(chats)
 
 @mcp.tool()
 def get_last_interaction(jid: str) -> str:
@@ -248,20 +273,127 @@ def download_media(message_id: str, chat_jid: str) -> Dict[str, Any]:
             "message": "Failed to download media"
         }
 
+_MESSAGES_CACHE_TTL = 60.0
+_MESSAGES_CACHE_SIZE = 64
+# (chat_jid, days_back, limit) -> (fetched_at, messages)
+_MESSAGES_CACHE: Dict[Tuple[str, int, int], Tuple[float, List[Any]]] = {}
+# Per-key locks so concurrent calls for the same chat share one fetch while
+# different chats are fetched in parallel
+_MESSAGES_FETCH_LOCKS: Dict[Tuple[str, int, int], threading.Lock] = {}
+# Guards the two dicts above; never held while querying the database
+_MESSAGES_CACHE_LOCK = threading.Lock()
+
+_CHAT_JID_CACHE_SIZE = 128
+# group_name -> (resolved_at, chat_jid); shares _MESSAGES_CACHE_TTL
+_CHAT_JID_CACHE: Dict[str, Tuple[float, str]] = {}
+_CHAT_JID_CACHE_LOCK = threading.Lock()
+
+
 def _resolve_chat_jid(group_name: str) -> Optional[str]:
-    """Look up a chat JID by partial group name match."""
+    """Look up a chat JID by partial group name match.
+
+    Matches are cached for the same TTL as the fetched messages, so a chat
+    renamed or recreated later is picked up again. Misses are not cached, so a
+    group created later is still found.
+    """
+    with _CHAT_JID_CACHE_LOCK:
+        cached = _CHAT_JID_CACHE.get(group_name)
+        if cached and time.monotonic() - cached[0] < _MESSAGES_CACHE_TTL:
+            return cached[1]
     chats = whatsapp_list_chats(query=group_name, limit=5, include_last_message=True)
-    if not chats:
+    jid = None
+    if chats:
+        if isinstance(chats[0], dict):
+            jid = chats[0].get("jid")
+        else:
+            jid = getattr(chats[0], "jid", None)
+    if not jid:
         return None
-    if isinstance(chats[0], dict):
-        return chats[0].get("jid")
-    return getattr(chats[0], "jid", None)
+    with _CHAT_JID_CACHE_LOCK:
+        _CHAT_JID_CACHE.pop(group_name, None)
+        _CHAT_JID_CACHE[group_name] = (time.monotonic(), jid)
+        if len(_CHAT_JID_CACHE) > _CHAT_JID_CACHE_SIZE:
+            del _CHAT_JID_CACHE[next(iter(_CHAT_JID_CACHE))]
+    return jid
+
+
+def _fetch_recent_messages(chat_jid: str, days_back: int, limit: int = 500) -> Optional[List[Any]]:
+    """Fetch the last days_back days of a chat for the extract_* tools.
+
+    Returns None when the chat has no messages in that window.
+
+    The itinerary and packing list tools are usually run back to back on the
+    same group, so results are shared between them for a short TTL. The cache
+    is keyed on days_back rather than the derived 'after' timestamp, which
+    changes on every call.
+    """
+    key = (chat_jid, days_back, limit)
+    with _MESSAGES_CACHE_LOCK:
+        fetch_lock = _MESSAGES_FETCH_LOCKS.setdefault(key, threading.Lock())
+
+    with fetch_lock:
+        with _MESSAGES_CACHE_LOCK:
+            cached = _MESSAGES_CACHE.get(key)
+            if cached and time.monotonic() - cached[0] < _MESSAGES_CACHE_TTL:
+                return cached[1]
+
+        after = (datetime.now() - timedelta(days=days_back)).isoformat()
+        messages = whatsapp_fetch_messages(
+            chat_jid=chat_jid,
+            after=after,
+            limit=limit,
+            include_context=False
+        )
+        if not messages:
+            with _MESSAGES_CACHE_LOCK:
+                _MESSAGES_CACHE.pop(key, None)
+            return None
+
+        with _MESSAGES_CACHE_LOCK:
+            _MESSAGES_CACHE.pop(key, None)
+            _MESSAGES_CACHE[key] = (time.monotonic(), messages)
+            if len(_MESSAGES_CACHE) > _MESSAGES_CACHE_SIZE:
+                del _MESSAGES_CACHE[next(iter(_MESSAGES_CACHE))]
+                # Drop locks of uncached keys, but never one a thread holds;
+                # its waiters must keep sharing it
+                for stale in [k for k, lock in _MESSAGES_FETCH_LOCKS.items()
+                              if k not in _MESSAGES_CACHE and not lock.locked()]:
+                    del _MESSAGES_FETCH_LOCKS[stale]
+        return messages
+
+
+_ITINERARY_PROMPT_TMPL = (
+    "You are a helpful trip planner assistant. Below are WhatsApp messages from a group trip planning chat.\n"
+    "Extract and organize all trip-related information into a clear, structured itinerary.\n"
+    "Include: dates, times, locations, hotel/accommodation details, activities, restaurant bookings, "
+    "transport plans, and any action items or things to confirm.\n"
+    "If exact dates are missing, make a note. Format as a day-by-day plan where possible.\n\n"
+    "MESSAGES:\n"
+    "{messages}\n\n"
+    "ITINERARY:"
+)
+
+_PACKING_PROMPT_TMPL = (
+    "You are a helpful trip assistant. Below are WhatsApp messages from a group trip planning chat.\n"
+    "Extract and consolidate everything related to packing and what people are bringing.\n"
+    "Look for: 'I'll bring', 'I'm packing', 'don't forget', 'we need', 'who's bringing', "
+    "'reminder to pack', and similar phrases.\n"
+    "Organize into categories: Clothes & Accessories, Toiletries, Tech & Gadgets, "
+    "Food & Drinks, Shared Supplies, Documents & Money, and Other.\n"
+    "For each item note who is bringing it if mentioned, and flag any items where no one "
+    "has volunteered yet.\n\n"
+    "MESSAGES:\n"
+    "{messages}\n\n"
+    "PACKING LIST:"
+)
 
 
 @mcp.tool()
-def extract_trip_itinerary(
+async def extract_trip_itinerary(
     group_name: str,
-    days_back: int = 30
+    days_back: int = 30,
+    max_messages: int = 200,
+    max_prompt_chars: int = 60_000
 ) -> str:
     """Extract a structured trip itinerary from a WhatsApp group chat.
 
@@ -271,41 +403,31 @@ def extract_trip_itinerary(
     Args:
         group_name: Name or partial name of the WhatsApp group (e.g. "girls trip")
         days_back: How many days back to scan for messages (default: 30)
+        max_messages: Maximum number of recent messages to scan (default: 200)
+        max_prompt_chars: Maximum characters of message text to include; whole messages are dropped past it (default: 60000)
     """
-    from datetime import datetime, timedelta
-
-    chat_jid = _resolve_chat_jid(group_name)
+    chat_jid = await asyncio.to_thread(_resolve_chat_jid, group_name)
     if not chat_jid:
         return f"Could not find a group matching '{group_name}'. Try list_chats to see available groups."
 
-    after = (datetime.now() - timedelta(days=days_back)).isoformat()
-    messages = whatsapp_list_messages(
-        chat_jid=chat_jid,
-        after=after,
-        limit=500,
-        include_context=False
-    )
+    # Keep the budget bounded; SQLite treats a negative LIMIT as no limit
+    max_messages = max(1, max_messages)
+    messages = await asyncio.to_thread(_fetch_recent_messages, chat_jid, days_back, max_messages)
 
-    if not messages or messages.startswith("No messages"):
+    if not messages:
         return "No messages found in this chat for the given time period."
 
-    prompt_prefix = (
-        "You are a helpful trip planner assistant. Below are WhatsApp messages from a group trip planning chat.\n"
-        "Extract and organize all trip-related information into a clear, structured itinerary.\n"
-        "Include: dates, times, locations, hotel/accommodation details, activities, restaurant bookings, "
-        "transport plans, and any action items or things to confirm.\n"
-        "If exact dates are missing, make a note. Format as a day-by-day plan where possible.\n\n"
-        "MESSAGES:\n"
-        f"{messages}\n\n"
-        "ITINERARY:"
-    )
-    return prompt_prefix
+    messages = await asyncio.to_thread(whatsapp_format_messages_list, messages, True, max(1, max_prompt_chars))
+
+    return _ITINERARY_PROMPT_TMPL.format(messages=messages)
 
 
 @mcp.tool()
-def extract_packing_list(
+async def extract_packing_list(
     group_name: str,
-    days_back: int = 30
+    days_back: int = 30,
+    max_messages: int = 200,
+    max_prompt_chars: int = 60_000
 ) -> str:
     """Extract a consolidated packing list from a WhatsApp group trip chat.
 
@@ -315,53 +437,207 @@ def extract_packing_list(
     Args:
         group_name: Name or partial name of the WhatsApp group (e.g. "girls trip")
         days_back: How many days back to scan for messages (default: 30)
+        max_messages: Maximum number of recent messages to scan (default: 200)
+        max_prompt_chars: Maximum characters of message text to include; whole messages are dropped past it (default: 60000)
     """
-    from datetime import datetime, timedelta
-
-    chat_jid = _resolve_chat_jid(group_name)
+    chat_jid = await asyncio.to_thread(_resolve_chat_jid, group_name)
     if not chat_jid:
         return f"Could not find a group matching '{group_name}'. Try list_chats to see available groups."
 
-    after = (datetime.now() - timedelta(days=days_back)).isoformat()
-    messages = whatsapp_list_messages(
-        chat_jid=chat_jid,
-        after=after,
-        limit=500,
-        include_context=False
-    )
+    # Keep the budget bounded; SQLite treats a negative LIMIT as no limit
+    max_messages = max(1, max_messages)
+    messages = await asyncio.to_thread(_fetch_recent_messages, chat_jid, days_back, max_messages)
 
-    if not messages or messages.startswith("No messages"):
+    if not messages:
         return "No messages found in this chat for the given time period."
 
-    prompt_prefix = (
-        "You are a helpful trip assistant. Below are WhatsApp messages from a group trip planning chat.\n"
-        "Extract and consolidate everything related to packing and what people are bringing.\n"
-        "Look for: 'I'll bring', 'I'm packing', 'don't forget', 'we need', 'who's bringing', "
-        "'reminder to pack', and similar phrases.\n"
-        "Organize into categories: Clothes & Accessories, Toiletries, Tech & Gadgets, "
-        "Food & Drinks, Shared Supplies, Documents & Money, and Other.\n"
-        "For each item note who is bringing it if mentioned, and flag any items where no one "
-        "has volunteered yet.\n\n"
-        "MESSAGES:\n"
-        f"{messages}\n\n"
-        "PACKING LIST:"
-    )
-    return prompt_prefix
+    messages = await asyncio.to_thread(whatsapp_format_messages_list, messages, True, max(1, max_prompt_chars))
+
+    return _PACKING_PROMPT_TMPL.format(messages=messages)
 
 
 CHAT_LISTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "chat_lists.json")
 
+_HEADER = "📋"
+_BULLET = "•"
+
+
+# (mtime_ns, parsed lists, casefolded list name -> list name) from the last
+# read of chat_lists.json
+_LISTS_CACHE: Optional[Tuple[int, Dict[str, List[str]], Dict[str, str]]] = None
+
+
+def _load_chat_lists() -> Tuple[Dict[str, List[str]], Dict[str, str]]:
+    """Load chat list definitions from chat_lists.json.
+
+    Returns the lists along with an index from casefolded list name to the
+    name as written in the file. Both are cached and only rebuilt when the
+    file's mtime changes.
+    """
+    global _LISTS_CACHE
+    try:
+        mtime = os.stat(CHAT_LISTS_PATH).st_mtime_ns
+    except FileNotFoundError:
+        _LISTS_CACHE = None
+        return {}, {}
+    if _LISTS_CACHE is not None and _LISTS_CACHE[0] == mtime:
+        return _LISTS_CACHE[1], _LISTS_CACHE[2]
+    with open(CHAT_LISTS_PATH, "rb") as f:
+        lists = orjson.loads(f.read())
+    # First definition wins when list names differ only by case
+    index = {}
+    for k in lists:
+        index.setdefault(k.casefold(), k)
+    _LISTS_CACHE = (mtime, lists, index)
+    return lists, index
+
+
+_DB_CONN: Optional[sqlite3.Connection] = None
+# (st_dev, st_ino) of the messages.db file _DB_CONN was opened on
+_DB_FILE_ID: Optional[Tuple[int, int]] = None
+# Whether _DB_CONN's SQLite can query the trigram chats_fts index; None until probed
+_DB_FTS_USABLE: Optional[bool] = None
+_DB_LOCK = threading.Lock()
+
+
+def _db_file_id() -> Optional[Tuple[int, int]]:
+    """Return the (st_dev, st_ino) of messages.db, or None if it is missing."""
+    try:
+        st = os.stat(DB_PATH)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def _get_db_connection() -> sqlite3.Connection:
+    """Return the shared messages.db connection, opening it on first use.
+
+    Keeping one connection alive lets SQLite reuse its page cache and compiled
+    statements across tool calls. The bridge owns the database and opens it in
+    WAL mode, so these reads do not block on its writes. If the file has been
+    deleted or replaced since, the connection is reopened on it. Callers must
+    hold _DB_LOCK while using it.
+    """
+    global _DB_CONN, _DB_FILE_ID, _DB_FTS_USABLE
+    if _DB_CONN is not None and _db_file_id() != _DB_FILE_ID:
+        _close_db_connection()
+    if _DB_CONN is None:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.create_function("casefold", 1, _casefold, deterministic=True)
+        _DB_CONN = conn
+        _DB_FILE_ID = _db_file_id()
+        _DB_FTS_USABLE = None
+    return _DB_CONN
+
+
+def _close_db_connection() -> None:
+    """Close the shared connection so the next call opens a fresh one."""
+    global _DB_CONN
+    if _DB_CONN is not None:
+        _DB_CONN.close()
+        _DB_CONN = None
+
+
+def _casefold(value: Optional[str]) -> Optional[str]:
+    """SQL casefold() function; SQLite's own lower() and LIKE only fold ASCII."""
+    return value.casefold() if value is not None else None
+
+
+def _like_pattern(keyword: str) -> str:
+    """Build a substring LIKE pattern, escaping LIKE wildcards in the keyword."""
+    escaped = keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
 
-def _load_chat_lists() -> Dict[str, List[str]]:
-    """Load chat list definitions from chat_lists.json."""
-    if not os.path.exists(CHAT_LISTS_PATH):
-        return {}
-    with open(CHAT_LISTS_PATH, "r") as f:
-        return json.load(f)
+
+def _fts_usable(cursor) -> bool:
+    """Return whether this connection can query the existing chats_fts table.
+
+    The bridge's SQLite may support FTS5 with the trigram tokenizer (SQLite
+    3.34+) while Python's bundled SQLite does not, so probe once per connection
+    with a trivial MATCH.
+    """
+    global _DB_FTS_USABLE
+    if _DB_FTS_USABLE is None:
+        try:
+            cursor.execute("SELECT rowid FROM chats_fts WHERE chats_fts MATCH '\"abc\"' LIMIT 1")
+            cursor.fetchall()
+            _DB_FTS_USABLE = True
+        except sqlite3.OperationalError:
+            _DB_FTS_USABLE = False
+    return _DB_FTS_USABLE
+
+
+def _keyword_filter(cursor, keywords: List[str]) -> Tuple[str, List[str]]:
+    """Build a WHERE clause matching chat names containing any keyword.
+
+    Uses the bridge's trigram chats_fts index while it is maintained. Trigrams
+    need at least three characters, and FTS case folding differs from
+    str.casefold for some non-ASCII letters, so short or non-ASCII keywords
+    fall back to a substring check: LIKE for ASCII keywords, where its ASCII
+    case folding is enough, and the slower Python casefold() otherwise.
+    """
+    # The bridge drops the sync triggers when built without FTS5, leaving any
+    # existing chats_fts table stale, so only trust it while they exist
+    cursor.execute("""
+        SELECT COUNT(*) FROM sqlite_master
+        WHERE (type = 'table' AND name = 'chats_fts')
+           OR (type = 'trigger' AND name = 'chats_fts_after_insert')
+    """)
+    has_fts = cursor.fetchone()[0] == 2 and _fts_usable(cursor)
+
+    clauses = []
+    params = []
+    fts_terms = []
+    for kw in keywords:
+        if has_fts and len(kw) >= 3 and kw.isascii():
+            fts_terms.append('"' + kw.replace('"', '""') + '"')
+        elif kw.isascii():
+            clauses.append("c.name LIKE ? ESCAPE '\\'")
+            params.append(_like_pattern(kw))
+        else:
+            clauses.append("instr(casefold(c.name), ?) > 0")
+            params.append(kw.casefold())
+    if fts_terms:
+        clauses.insert(0, "c.rowid IN (SELECT rowid FROM chats_fts WHERE chats_fts MATCH ?)")
+        params.insert(0, " OR ".join(fts_terms))
+    return " OR ".join(clauses), params
+
+
+def _format_list_chat(row: Tuple[str, str, Optional[str], Optional[str]]) -> str:
+    """Format one (jid, name, last_message_time, last_message) row for get_list_chats."""
+    _, name, last_time, last_msg = row
+    preview = (last_msg[:60] + "...") if last_msg and len(last_msg) > 60 else (last_msg or "")
+    return f"{_BULLET} {name}  [{last_time}]\n  {preview}"
+
+
+def _list_chat_lines(keywords: List[str]) -> List[str]:
+    """Return a formatted line for every named chat matching any keyword."""
+    # Match keywords against ALL named chats inside SQLite (no limit);
+    # FTS, LIKE (ASCII keywords) and casefold() are all case-insensitive
+    with _DB_LOCK:
+        cursor = _get_db_connection().cursor()
+        try:
+            keyword_clauses, params = _keyword_filter(cursor, keywords)
+            cursor.execute(f"""
+                SELECT c.jid, c.name, c.last_message_time,
+                    (SELECT m.content FROM messages m
+                     WHERE m.chat_jid = c.jid AND m.timestamp = c.last_message_time
+                     LIMIT 1) as last_message
+                FROM chats c
+                WHERE c.name != '' AND ({keyword_clauses})
+                ORDER BY c.last_message_time DESC
+            """, params)
+            return [_format_list_chat(row) for row in cursor]
+        except sqlite3.OperationalError:
+            # The connection may be unusable (e.g. the file was swapped while in
+            # use), so reopen it on the next call rather than failing forever
+            _close_db_connection()
+            raise
 
 
 @mcp.tool()
-def get_list_chats(list_name: str) -> str:
+async def get_list_chats(list_name: str) -> str:
     """Get all WhatsApp chats and groups belonging to a custom list.
 
     Lists are defined in chat_lists.json — each list maps to a set of
@@ -371,50 +647,30 @@ def get_list_chats(list_name: str) -> str:
     Args:
         list_name: Name of the list (e.g. "Dance", "Family", "Neighbors")
     """
-    import sqlite3 as _sqlite3
-
-    lists = _load_chat_lists()
+    lists, index = _load_chat_lists()
 
     if not lists:
         return "No lists defined. Edit chat_lists.json in the whatsapp-mcp-server folder to create your lists."
 
     # Case-insensitive match for list name
-    matched_key = next((k for k in lists if k.lower() == list_name.lower()), None)
+    matched_key = index.get(list_name.casefold())
     if not matched_key:
         available = ", ".join(lists.keys())
         return f"List '{list_name}' not found. Available lists: {available}"
 
     keywords = lists[matched_key]
 
-    # Query ALL named chats directly from the database (no limit)
-    db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'whatsapp-bridge', 'store', 'messages.db')
-    try:
-        conn = _sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT c.jid, c.name, c.last_message_time, m.content as last_message
-            FROM chats c
-            LEFT JOIN messages m ON c.jid = m.chat_jid AND c.last_message_time = m.timestamp
-            WHERE c.name != ''
-            ORDER BY c.last_message_time DESC
-        """)
-        all_chats = cursor.fetchall()
-        conn.close()
-    except _sqlite3.Error as e:
-        return f"Database error: {e}"
-
-    matches = [(jid, name, last_time, last_msg) for jid, name, last_time, last_msg in all_chats
-               if any(kw.lower() in (name or '').lower() for kw in keywords)]
-
-    if not matches:
-        return f"No chats found for list '{matched_key}' with keywords: {keywords}\nTry editing chat_lists.json to adjust the keywords."
+    lines = []
+    if keywords:
+        try:
+            lines = await asyncio.to_thread(_list_chat_lines, keywords)
+        except sqlite3.Error as e:
+            return f"Database error: {e}"
 
-    lines = [f"📋 {matched_key} ({len(matches)} chats)\n"]
-    for jid, name, last_time, last_msg in matches:
-        preview = (last_msg[:60] + "...") if last_msg and len(last_msg) > 60 else (last_msg or "")
-        lines.append(f"• {name}  [{last_time}]\n  {preview}")
+    if not lines:
+        return f"No chats found for list '{matched_key}' with keywords: {keywords}\nTry editing chat_lists.json to adjust the keywords."
 
-    return "\n".join(lines)
+    return f"{_HEADER} {matched_key} ({len(lines)} chats)\n\n" + "\n".join(lines)
 
 
 @mcp.tool()
@@ -424,16 +680,13 @@ def show_all_lists() -> str:
     Returns your list names and the keywords used to match chats to each list.
     Edit chat_lists.json to add, remove or rename lists and keywords.
     """
-    lists = _load_chat_lists()
+    lists, _ = _load_chat_lists()
 
     if not lists:
         return "No lists defined. Edit chat_lists.json in the whatsapp-mcp-server folder to create your lists."
 
-    lines = ["📋 Your Custom Chat Lists\n"]
-    for list_name, keywords in lists.items():
-        lines.append(f"• {list_name}: {', '.join(keywords)}")
-    lines.append(f"\nEdit: {CHAT_LISTS_PATH}")
-    return "\n".join(lines)
+    body = "\n".join(f"{_BULLET} {list_name}: {', '.join(keywords)}" for list_name, keywords in lists.items())
+    return f"{_HEADER} Your Custom Chat Lists\n\n{body}\n\nEdit: {CHAT_LISTS_PATH}"
 
 
 if __name__ == "__main__":
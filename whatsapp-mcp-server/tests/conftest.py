@@ -0,0 +1,65 @@
+import json
+import sqlite3
+
+import pytest
+
+import main
+import whatsapp
+
+SCHEMA = """
+    CREATE TABLE chats (
+        jid TEXT PRIMARY KEY,
+        name TEXT,
+        last_message_time TIMESTAMP
+    );
+
+    CREATE TABLE messages (
+        id TEXT,
+        chat_jid TEXT,
+        sender TEXT,
+        content TEXT,
+        timestamp TIMESTAMP,
+        is_from_me BOOLEAN,
+        media_type TEXT,
+        filename TEXT,
+        url TEXT,
+        media_key BLOB,
+        file_sha256 BLOB,
+        file_enc_sha256 BLOB,
+        file_length INTEGER,
+        PRIMARY KEY (id, chat_jid),
+        FOREIGN KEY (chat_jid) REFERENCES chats(jid)
+    );
+"""
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """An empty messages.db wired into both the server and the client module."""
+    path = str(tmp_path / "messages.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    conn.commit()
+
+    monkeypatch.setattr(whatsapp, "MESSAGES_DB_PATH", path)
+    monkeypatch.setattr(main, "DB_PATH", path)
+    monkeypatch.setattr(main, "_DB_CONN", None)
+    monkeypatch.setattr(main, "_DB_FILE_ID", None)
+    monkeypatch.setattr(main, "_DB_FTS_USABLE", None)
+    yield conn
+    if main._DB_CONN is not None:
+        main._DB_CONN.close()
+    conn.close()
+
+
+@pytest.fixture
+def chat_lists(tmp_path, monkeypatch):
+    """Write chat_lists.json with the given lists and point the server at it."""
+    path = tmp_path / "chat_lists.json"
+    monkeypatch.setattr(main, "CHAT_LISTS_PATH", str(path))
+    monkeypatch.setattr(main, "_LISTS_CACHE", None)
+
+    def write(lists):
+        path.write_text(json.dumps(lists, ensure_ascii=False), encoding="utf-8")
+
+    return write
@@ -0,0 +1,148 @@
+import asyncio
+import os
+import sqlite3
+
+import main
+
+
+def add_chats(db, *names):
+    for i, name in enumerate(names):
+        db.execute(
+            "INSERT INTO chats (jid, name, last_message_time) VALUES (?, ?, ?)",
+            (f"{i}@g.us", name, f"2026-01-{i + 1:02d} 10:00:00"),
+        )
+    db.commit()
+
+
+def add_fts(db, with_triggers=True):
+    db.executescript("""
+        CREATE VIRTUAL TABLE chats_fts USING fts5(name, tokenize = 'trigram');
+        INSERT INTO chats_fts (rowid, name) SELECT rowid, name FROM chats;
+    """)
+    if with_triggers:
+        db.executescript("""
+            CREATE TRIGGER chats_fts_after_insert AFTER INSERT ON chats BEGIN
+                INSERT INTO chats_fts (rowid, name) VALUES (new.rowid, new.name);
+            END;
+        """)
+    db.commit()
+
+
+def get_list_chats(list_name):
+    return asyncio.run(main.get_list_chats(list_name))
+
+
+def test_non_ascii_keywords_match_case_insensitively(db, chat_lists):
+    add_chats(db, "Família Silva", "ÉCOLE de danse", "Work")
+    chat_lists({"Family": ["FAMÍLIA"], "Dance": ["école"]})
+
+    assert "Família Silva" in get_list_chats("Family")
+    assert "ÉCOLE de danse" in get_list_chats("Dance")
+    assert "Work" not in get_list_chats("Family")
+
+
+def test_non_ascii_and_short_keywords_match_with_fts(db, chat_lists):
+    add_chats(db, "Família Silva", "ÉCOLE de danse", "MV Neighbors", "Work")
+    add_fts(db)
+    chat_lists({"Mixed": ["FAMÍLIA", "école", "mv"], "Work": ["WORK"]})
+
+    result = get_list_chats("Mixed")
+    assert "(3 chats)" in result
+    assert "Work" not in result
+    assert "(1 chats)" in get_list_chats("Work")
+    assert main._DB_FTS_USABLE is True
+
+
+def test_like_wildcards_in_keywords_are_literal(db, chat_lists):
+    add_chats(db, "50% OFF", "5000 club", "MY_GROUP", "myxgroup", "back\\slash", "backslash")
+    chat_lists({"Deals": ["0% off"], "Groups": ["my_"], "Slash": ["k\\s"]})
+
+    result = get_list_chats("Deals")
+    assert "50% OFF" in result
+    assert "5000 club" not in result
+
+    result = get_list_chats("Groups")
+    assert "MY_GROUP" in result
+    assert "myxgroup" not in result
+
+    result = get_list_chats("Slash")
+    assert "(1 chats)" in result
+    assert "back\\slash" in result
+
+
+def test_ascii_keywords_use_like_not_python_casefold(db, chat_lists, monkeypatch):
+    add_chats(db, "MV Neighbors", "Família Silva")
+    chat_lists({"Ascii": ["mv", "SILVA"]})
+    folded = []
+    real_casefold = main._casefold
+    monkeypatch.setattr(main, "_casefold", lambda value: folded.append(value) or real_casefold(value))
+
+    result = get_list_chats("Ascii")
+    assert "(2 chats)" in result
+    assert folded == []
+
+
+def test_stale_fts_index_without_triggers_is_ignored(db, chat_lists):
+    add_fts(db, with_triggers=False)
+    add_chats(db, "Dance Practice")
+    chat_lists({"Dance": ["dance"]})
+
+    assert "Dance Practice" in get_list_chats("Dance")
+
+
+def test_fts_index_unreadable_by_python_sqlite_is_ignored(db, chat_lists):
+    # Stands in for an index built with a tokenizer this SQLite lacks: the
+    # schema looks right but MATCH fails
+    db.executescript("""
+        CREATE TABLE chats_fts (name TEXT);
+        CREATE TRIGGER chats_fts_after_insert AFTER INSERT ON chats BEGIN
+            INSERT INTO chats_fts (rowid, name) VALUES (new.rowid, new.name);
+        END;
+    """)
+    add_chats(db, "Dance Practice")
+    chat_lists({"Dance": ["dance"]})
+
+    assert "Dance Practice" in get_list_chats("Dance")
+    assert main._DB_FTS_USABLE is False
+
+
+def test_replaced_database_is_reopened(db, chat_lists):
+    add_chats(db, "Old Dance Group")
+    chat_lists({"Dance": ["dance"]})
+    assert "Old Dance Group" in get_list_chats("Dance")
+
+    path = main.DB_PATH
+    replacement = sqlite3.connect(path + ".new")
+    db.backup(replacement)
+    replacement.execute("DELETE FROM chats")
+    add_chats(replacement, "New Dance Group")
+    replacement.close()
+    os.replace(path + ".new", path)
+
+    result = get_list_chats("Dance")
+    assert "New Dance Group" in result
+    assert "Old Dance Group" not in result
+
+
+def test_connection_is_reopened_after_operational_error(db, chat_lists):
+    chat_lists({"Dance": ["dance"]})
+    stale = main._get_db_connection()
+    db.execute("DROP TABLE chats")
+    db.commit()
+
+    assert get_list_chats("Dance").startswith("Database error:")
+    assert main._DB_CONN is None
+
+    db.executescript("CREATE TABLE chats (jid TEXT PRIMARY KEY, name TEXT, last_message_time TIMESTAMP)")
+    add_chats(db, "Dance Practice")
+    assert "Dance Practice" in get_list_chats("Dance")
+    assert main._DB_CONN is not stale
+
+
+def test_list_names_match_case_insensitively_first_wins(db, chat_lists):
+    add_chats(db, "Dance Practice", "Bharatanatyam class")
+    chat_lists({"Dance": ["practice"], "dance": ["bharatanatyam"]})
+
+    result = get_list_chats("DANCE")
+    assert result.startswith(f"{main._HEADER} Dance (1 chats)")
+    assert "Dance Practice" in result
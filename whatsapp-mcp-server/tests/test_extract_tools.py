@@ -0,0 +1,52 @@
+import asyncio
+import time
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def trip_chat(db, monkeypatch):
+    """A group chat with multi-line messages, newest first at 10:0N."""
+    monkeypatch.setattr(main, "_MESSAGES_CACHE", {})
+    monkeypatch.setattr(main, "_MESSAGES_FETCH_LOCKS", {})
+    monkeypatch.setattr(main, "_CHAT_JID_CACHE", {})
+    db.execute("INSERT INTO chats (jid, name, last_message_time) VALUES ('trip@g.us', 'Girls Trip', '2999-01-01 10:09:00')")
+    for i in range(10):
+        db.execute(
+            "INSERT INTO messages (id, chat_jid, sender, content, timestamp, is_from_me) VALUES (?, 'trip@g.us', '111', ?, ?, 0)",
+            (f"m{i}", f"plan {i} line one\nplan {i} line two", f"2999-01-01 10:0{i}:00"),
+        )
+    db.commit()
+
+
+def test_prompt_budget_keeps_whole_messages(trip_chat):
+    full = asyncio.run(main.extract_packing_list("girls trip"))
+    assert "plan 0 line two" in full
+
+    prompt = asyncio.run(main.extract_packing_list("girls trip", max_prompt_chars=200))
+    messages = prompt.split("MESSAGES:\n", 1)[1].rsplit("\n\nPACKING LIST:", 1)[0]
+    assert 0 < len(messages) <= 200
+    assert "plan 9 line one\nplan 9 line two" in messages
+    for i in range(10):
+        assert (f"plan {i} line one" in messages) == (f"plan {i} line two" in messages)
+    assert "plan 0" not in messages
+
+
+def test_max_messages_is_clamped_to_at_least_one(trip_chat):
+    prompt = asyncio.run(main.extract_trip_itinerary("girls trip", max_messages=-1))
+    assert "plan 9" in prompt
+    assert "plan 8" not in prompt
+
+
+def test_resolved_chat_jid_expires_after_ttl(trip_chat, db, monkeypatch):
+    assert main._resolve_chat_jid("girls trip") == "trip@g.us"
+    db.execute("UPDATE chats SET name = 'Old Trip' WHERE jid = 'trip@g.us'")
+    db.execute("INSERT INTO chats (jid, name, last_message_time) VALUES ('new@g.us', 'Girls Trip 2', '2999-01-02 10:00:00')")
+    db.commit()
+    assert main._resolve_chat_jid("girls trip") == "trip@g.us"
+
+    now = time.monotonic()
+    monkeypatch.setattr(main.time, "monotonic", lambda: now + main._MESSAGES_CACHE_TTL + 1)
+    assert main._resolve_chat_jid("girls trip") == "new@g.us"
@@ -0,0 +1,20 @@
+import asyncio
+import json
+
+import main
+
+
+def test_list_chats_sends_json_once_as_text(db):
+    db.execute("INSERT INTO chats (jid, name, last_message_time) VALUES ('1@g.us', 'Dance', '2026-01-01 10:00:00')")
+    db.commit()
+
+    result = asyncio.run(main.mcp.call_tool("list_chats", {"include_last_message": True}))
+    content = result[0] if isinstance(result, tuple) else result
+    if isinstance(result, tuple):
+        # Structured output is disabled, so only the text block carries data
+        assert not result[1]
+
+    assert len(content) == 1
+    chats = json.loads(content[0].text)
+    assert chats[0]["jid"] == "1@g.us"
+    assert chats[0]["name"] == "Dance"
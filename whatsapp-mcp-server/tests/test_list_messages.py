@@ -0,0 +1,7 @@
+import main
+
+
+def test_list_messages_reports_database_errors(db):
+    db.execute("DROP TABLE messages")
+    db.commit()
+    assert main.list_messages(include_context=False).startswith("Error:")
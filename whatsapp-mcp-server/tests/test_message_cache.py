@@ -0,0 +1,100 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import main
+
+
+class Fetches(list):
+    """Chat JIDs passed to the stubbed fetch, plus canned results per JID."""
+
+    def __init__(self):
+        super().__init__()
+        self.results = {}
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    calls = Fetches()
+
+    def fake_fetch(chat_jid, after, limit, include_context):
+        calls.append(chat_jid)
+        return calls.results.get(chat_jid, [SimpleNamespace(chat_jid=chat_jid)])
+
+    monkeypatch.setattr(main, "whatsapp_fetch_messages", fake_fetch)
+    monkeypatch.setattr(main, "_MESSAGES_CACHE", {})
+    monkeypatch.setattr(main, "_MESSAGES_FETCH_LOCKS", {})
+    return calls
+
+
+def test_repeat_fetch_within_ttl_is_cached(fetches):
+    first = main._fetch_recent_messages("a@g.us", 30)
+    assert first == [SimpleNamespace(chat_jid="a@g.us")]
+    assert main._fetch_recent_messages("a@g.us", 30) is first
+    assert fetches == ["a@g.us"]
+
+    main._fetch_recent_messages("a@g.us", 7)
+    assert fetches == ["a@g.us", "a@g.us"]
+
+
+def test_expired_entry_is_refetched(fetches, monkeypatch):
+    main._fetch_recent_messages("a@g.us", 30)
+    now = time.monotonic()
+    monkeypatch.setattr(main.time, "monotonic", lambda: now + main._MESSAGES_CACHE_TTL + 1)
+    main._fetch_recent_messages("a@g.us", 30)
+    assert fetches == ["a@g.us", "a@g.us"]
+
+
+def test_oldest_entry_is_evicted(fetches, monkeypatch):
+    monkeypatch.setattr(main, "_MESSAGES_CACHE_SIZE", 2)
+    for jid in ("a", "b", "c"):
+        main._fetch_recent_messages(jid, 30)
+    assert list(main._MESSAGES_CACHE) == [("b", 30, 500), ("c", 30, 500)]
+    assert ("a", 30, 500) not in main._MESSAGES_FETCH_LOCKS
+
+    main._fetch_recent_messages("a", 30)
+    assert fetches == ["a", "b", "c", "a"]
+
+
+def test_eviction_keeps_locks_that_are_held(fetches, monkeypatch):
+    monkeypatch.setattr(main, "_MESSAGES_CACHE_SIZE", 1)
+    fetches.results["empty"] = []
+    main._fetch_recent_messages("empty", 30)
+    busy = main._MESSAGES_FETCH_LOCKS.setdefault(("busy", 30, 500), threading.Lock())
+    with busy:
+        main._fetch_recent_messages("a", 30)
+        main._fetch_recent_messages("b", 30)
+        assert main._MESSAGES_FETCH_LOCKS[("busy", 30, 500)] is busy
+    assert ("empty", 30, 500) not in main._MESSAGES_FETCH_LOCKS
+    assert ("a", 30, 500) not in main._MESSAGES_FETCH_LOCKS
+
+
+def test_empty_results_are_not_cached(fetches):
+    fetches.results["empty"] = []
+    assert main._fetch_recent_messages("empty", 30) is None
+    assert main._fetch_recent_messages("empty", 30) is None
+    assert fetches == ["empty", "empty"]
+    assert main._MESSAGES_CACHE == {}
+
+
+def test_different_chats_are_fetched_concurrently(monkeypatch, fetches):
+    started = threading.Barrier(2, timeout=5)
+
+    def slow_fetch(chat_jid, after, limit, include_context):
+        # Both fetches must be in flight at once to pass the barrier
+        started.wait()
+        return [SimpleNamespace(chat_jid=chat_jid)]
+
+    monkeypatch.setattr(main, "whatsapp_fetch_messages", slow_fetch)
+    results = {}
+    threads = [
+        threading.Thread(target=lambda jid=jid: results.setdefault(jid, main._fetch_recent_messages(jid, 30)))
+        for jid in ("a", "b")
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == {"a": [SimpleNamespace(chat_jid="a")], "b": [SimpleNamespace(chat_jid="b")]}
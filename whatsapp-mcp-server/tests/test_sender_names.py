@@ -0,0 +1,33 @@
+import whatsapp
+
+
+def add_contacts(db, contacts):
+    db.executemany("INSERT INTO chats (jid, name) VALUES (?, ?)", contacts)
+    db.commit()
+
+
+def test_batched_names_match_single_lookups(db):
+    add_contacts(db, [
+        ("111@s.whatsapp.net", "Alice"),
+        ("222@s.whatsapp.net", ""),
+        ("333@s.whatsapp.net", "Carol"),
+        ("333", ""),
+        ("444x@g.us", "Group"),
+        ("9@s.whatsapp.net", "Nine"),
+    ])
+    senders = ["111", "222", "333", "444", "555", "9", "9@s.whatsapp.net", "111@s.whatsapp.net"]
+
+    names = whatsapp.get_sender_names(senders)
+
+    assert names == {sender: whatsapp.get_sender_name(sender) for sender in senders}
+
+
+def test_many_unmatched_senders_still_resolve_known_ones(db):
+    add_contacts(db, [("15550001@s.whatsapp.net", "Known")])
+    senders = [f"99{i:06d}" for i in range(1200)] + ["15550001"]
+
+    names = whatsapp.get_sender_names(senders)
+
+    assert names["15550001"] == "Known"
+    assert names["99000000"] == "99000000"
+    assert len(names) == len(senders)
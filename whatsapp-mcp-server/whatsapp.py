@@ -1,13 +1,14 @@
 import sqlite3
 from datetime import datetime
 from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, Dict
 import os.path
-import requests
 import json
 import audio
+# requests is imported inside the send and download functions: it is a large
+# share of server start-up time and only those bridge API calls need it
 
-MESSAGES_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'whatsapp-bridge', 'store', 'messages.db')
+MESSAGES_DB_PATH = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'whatsapp-bridge', 'store', 'messages.db'))
 WHATSAPP_API_BASE_URL = "http://localhost:8080/api"
 
 @dataclass
@@ -91,7 +92,74 @@ def get_sender_name(sender_jid: str) -> str:
         if 'conn' in locals():
             conn.close()
 
-def format_message(message: Message, show_chat_info: bool = True) -> None:
+# Senders per batched lookup query; keeps the OR'd LIKE expression well below
+# SQLite's expression depth limit of 1000
+SENDER_NAME_BATCH_SIZE = 500
+
+def get_sender_names(sender_jids: List[str]) -> Dict[str, str]:
+    """Resolve display names for many senders at once.
+
+    Applies the same matching rules as get_sender_name, but batches the exact
+    and partial JID lookups into a few queries instead of one per message.
+    """
+    unique_jids = list(dict.fromkeys(sender_jids))
+    names = {jid: jid for jid in unique_jids}
+    if not unique_jids:
+        return names
+
+    try:
+        conn = sqlite3.connect(MESSAGES_DB_PATH)
+        cursor = conn.cursor()
+
+        # First try matching by exact JID
+        exact = {}
+        for i in range(0, len(unique_jids), SENDER_NAME_BATCH_SIZE):
+            batch = unique_jids[i:i + SENDER_NAME_BATCH_SIZE]
+            values = ", ".join(["(?)"] * len(batch))
+            cursor.execute(f"""
+                SELECT jid, name
+                FROM chats
+                WHERE jid IN (VALUES {values})
+            """, batch)
+            exact.update(cursor.fetchall())
+
+        for jid, name in exact.items():
+            if name:
+                names[jid] = name
+
+        # For the rest, look for the number within JIDs
+        phone_parts = {jid: jid.split('@')[0] for jid in unique_jids if jid not in exact}
+        parts = list(phone_parts.values())
+        candidates = {}
+        for i in range(0, len(parts), SENDER_NAME_BATCH_SIZE):
+            batch = parts[i:i + SENDER_NAME_BATCH_SIZE]
+            clauses = " OR ".join(["jid LIKE ?"] * len(batch))
+            cursor.execute(f"""
+                SELECT rowid, jid, name
+                FROM chats
+                WHERE {clauses}
+            """, [f"%{part}%" for part in batch])
+            for rowid, jid, name in cursor.fetchall():
+                candidates[rowid] = (jid, name)
+
+        # get_sender_name takes the first LIKE match in table order
+        ordered = [candidates[rowid] for rowid in sorted(candidates)]
+        for jid, part in phone_parts.items():
+            part = part.lower()
+            match = next((row for row in ordered if part in row[0].lower()), None)
+            if match and match[1]:
+                names[jid] = match[1]
+
+        return names
+
+    except sqlite3.Error as e:
+        print(f"Database error while getting sender names, resolving one by one: {e}")
+        return {jid: get_sender_name(jid) for jid in unique_jids}
+    finally:
+        if 'conn' in locals():
+            conn.close()
+
+def format_message(message: Message, show_chat_info: bool = True, sender_names: Optional[Dict[str, str]] = None) -> None:
     """Print a single message with consistent formatting."""
     output = ""
     
@@ -105,20 +173,36 @@ def format_message(message: Message, show_chat_info: bool = True) -> None:
         content_prefix = f"[{message.media_type} - Message ID: {message.id} - Chat JID: {message.chat_jid}] "
     
     try:
-        sender_name = get_sender_name(message.sender) if not message.is_from_me else "Me"
+        if message.is_from_me:
+            sender_name = "Me"
+        elif sender_names and message.sender in sender_names:
+            sender_name = sender_names[message.sender]
+        else:
+            sender_name = get_sender_name(message.sender)
         output += f"From: {sender_name}: {content_prefix}{message.content}\n"
     except Exception as e:
         print(f"Error formatting message: {e}")
     return output
 
-def format_messages_list(messages: List[Message], show_chat_info: bool = True) -> None:
+def format_messages_list(messages: List[Message], show_chat_info: bool = True, max_chars: Optional[int] = None) -> str:
+    """Format messages for display, stopping before the first whole message past max_chars.
+
+    If even the first message exceeds max_chars it is cut to fit rather than
+    returning nothing.
+    """
     output = ""
     if not messages:
         output += "No messages to display."
         return output
     
+    sender_names = get_sender_names([m.sender for m in messages if not m.is_from_me])
     for message in messages:
-        output += format_message(message, show_chat_info)
+        formatted = format_message(message, show_chat_info, sender_names)
+        if max_chars is not None and len(output) + len(formatted) > max_chars:
+            if not output:
+                output = formatted[:max_chars]
+            break
+        output += formatted
     return output
 
 def list_messages(
@@ -132,8 +216,41 @@ def list_messages(
     include_context: bool = True,
     context_before: int = 1,
     context_after: int = 1
-) -> List[Message]:
-    """Get messages matching the specified criteria with optional context."""
+) -> str:
+    """Get messages matching the specified criteria with optional context, formatted for display."""
+    messages = fetch_messages(
+        after=after,
+        before=before,
+        sender_phone_number=sender_phone_number,
+        chat_jid=chat_jid,
+        query=query,
+        limit=limit,
+        page=page,
+        include_context=include_context,
+        context_before=context_before,
+        context_after=context_after
+    )
+    if messages is None:
+        return "Error: could not read messages from the database."
+    return format_messages_list(messages, show_chat_info=True)
+
+
+def fetch_messages(
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    sender_phone_number: Optional[str] = None,
+    chat_jid: Optional[str] = None,
+    query: Optional[str] = None,
+    limit: int = 20,
+    page: int = 0,
+    include_context: bool = True,
+    context_before: int = 1,
+    context_after: int = 1
+) -> Optional[List[Message]]:
+    """Get messages matching the specified criteria with optional context.
+
+    Returns an empty list when nothing matches and None on database errors.
+    """
     try:
         conn = sqlite3.connect(MESSAGES_DB_PATH)
         cursor = conn.cursor()
@@ -210,14 +327,13 @@ def list_messages(
                 messages_with_context.append(context.message)
                 messages_with_context.extend(context.after)
             
-            return format_messages_list(messages_with_context, show_chat_info=True)
+            return messages_with_context
             
-        # Format and display messages without context
-        return format_messages_list(result, show_chat_info=True)    
+        return result
         
     except sqlite3.Error as e:
         print(f"Database error: {e}")
-        return []
+        return None
     finally:
         if 'conn' in locals():
             conn.close()
@@ -623,6 +739,8 @@ def get_direct_chat_by_contact(sender_phone_number: str) -> Optional[Chat]:
             conn.close()
 
 def send_message(recipient: str, message: str) -> Tuple[bool, str]:
+    import requests
+
     try:
         # Validate input
         if not recipient:
@@ -651,6 +769,8 @@ def send_message(recipient: str, message: str) -> Tuple[bool, str]:
         return False, f"Unexpected error: {str(e)}"
 
 def send_file(recipient: str, media_path: str) -> Tuple[bool, str]:
+    import requests
+
     try:
         # Validate input
         if not recipient:
@@ -685,6 +805,8 @@ def send_file(recipient: str, media_path: str) -> Tuple[bool, str]:
         return False, f"Unexpected error: {str(e)}"
 
 def send_audio_message(recipient: str, media_path: str) -> Tuple[bool, str]:
+    import requests
+
     try:
         # Validate input
         if not recipient:
@@ -734,6 +856,8 @@ def download_media(message_id: str, chat_jid: str) -> Optional[str]:
     Returns:
         The local file path if download was successful, None otherwise
     """
+    import requests
+
     try:
         url = f"{WHATSAPP_API_BASE_URL}/download"
         payload = {